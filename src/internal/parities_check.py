@@ -76,6 +76,19 @@ CLI_FLAG_FINDER_RE = re.compile(r"(?<!\S)(-{1,3}[A-Za-z][A-Za-z-]*|-u{2,3})(?!\S
 
 GLOB_CHARS_RE = re.compile(r"[\*\?\[]")
 
+# Bare filename with a known extension, e.g. "cli_common.py"
+BARE_FILENAME_RE = re.compile(
+    r"\S+\.(py|md|rst|txt|json|jsonl|toml|yaml|yml|ini|cfg|lock|rs|ts|tsx|js|jsx|sh|bat|conf|mdx)",
+    re.IGNORECASE,
+)
+ALL_CAPS_RE = re.compile(r"[A-Z0-9_]+")
+TRAILING_PARENS_RE = re.compile(r"\s*\((?:\s*\.\.\.\s*)?\)\s*$")
+WHITESPACE_RE = re.compile(r"\s")
+# Separators in combined CLI flags like "-l/--only-headers" or "-l, --only-headers"
+FLAG_SEPARATOR_RE = re.compile(r"\s*[/,]\s*")
+TITLE_ID_RE = re.compile(r"\[(?P<id>[^\]]+)\]")
+DASHES_RE = re.compile(r"-+")
+
 
 def normalize_symbol_token(token: str) -> str:
     """
@@ -89,7 +102,7 @@ def normalize_symbol_token(token: str) -> str:
     """
     t = token.strip()
     # Remove trailing () or (...)
-    t = re.sub(r"\s*\((?:\s*\.\.\.\s*)?\)\s*$", "", t)
+    t = TRAILING_PARENS_RE.sub("", t)
     return t
 
 
@@ -112,7 +125,7 @@ def extract_ast_tokens_from_members(member_lines: List[str]) -> List[str]:
             if "*" in token:
                 continue
             # Skip ALL_CAPS constants which symbex cannot resolve
-            if re.fullmatch(r"[A-Z0-9_]+", token):
+            if ALL_CAPS_RE.fullmatch(token):
                 continue
             tokens.append(token)
     return tokens
@@ -131,7 +144,7 @@ def extract_constant_tokens_from_members(member_lines: List[str]) -> List[str]:
             token = raw.strip()
             if LIKELY_FILE_RE.search(token) or token in {"README.md", "LICENSE"}:
                 continue
-            if "*" in token or re.fullmatch(r"[A-Z0-9_]+", token):
+            if "*" in token or ALL_CAPS_RE.fullmatch(token):
                 constants.append(token)
     # preserve order, de-duplicate
     seen: set = set()
@@ -159,16 +172,12 @@ def _is_file_like_token(token: str) -> bool:
     if t in {"README.md", "LICENSE"}:
         return True
     # Bare filename with extension
-    if re.fullmatch(
-        r"\S+\.(py|md|rst|txt|json|jsonl|toml|yaml|yml|ini|cfg|lock|rs|ts|tsx|js|jsx|sh|bat|conf|mdx)",
-        t,
-        flags=re.IGNORECASE,
-    ):
+    if BARE_FILENAME_RE.fullmatch(t):
         return True
     # Slash-based path with no whitespace
-    if "/" in t and not re.search(r"\s", t):
+    if "/" in t and not WHITESPACE_RE.search(t):
         # Guard against combined CLI flags like -f/--foo
-        parts = re.split(r"/", t)
+        parts = t.split("/")
         if parts and all(not CLI_FLAG_RE.match(p or "") for p in parts):
             return True
     return False
@@ -207,7 +216,7 @@ class SetBlock:
                     continue
                 # Skip combined CLI flags like "-l/--only-headers" or with commas
                 if "/" in tok or "," in tok:
-                    parts = re.split(r"\s*[/,]\s*", tok)
+                    parts = FLAG_SEPARATOR_RE.split(tok)
                     if parts and all(CLI_FLAG_RE.match(p.strip() or "") for p in parts):
                         continue
                 # filter obvious non-paths
@@ -235,16 +244,18 @@ class SetBlock:
 
     def backtick_tokens_in_sections(self, section_names: Optional[List[str]] = None) -> List[str]:
         """Return all backticked tokens from specified sections (defaults to all)."""
-        tokens: List[str] = []
         sections = section_names or list(self.sections.keys())
-        for name in sections:
-            for line in self.sections.get(name, []):
-                tokens.extend([tok.strip() for tok in BACKTICK_TOKEN_RE.findall(line)])
-        return tokens
+        findall = BACKTICK_TOKEN_RE.findall
+        # Matched per line, not on the joined text, so an unclosed backtick can't span lines.
+        return [
+            tok.strip()
+            for name in sections
+            for line in self.sections.get(name, [])
+            for tok in findall(line)
+        ]
 
     def _extract_cli_flags_from_lines(self, lines: List[str]) -> List[str]:
         flags: List[str] = []
-        separators = re.compile(r"\s*[/,]\s*")
 
         def _add_from_token(token: str) -> None:
             t = token.strip()
@@ -255,7 +266,7 @@ class SetBlock:
             if CLI_FLAG_RE.match(t):
                 flags.append(t)
                 return
-            for part in separators.split(t):
+            for part in FLAG_SEPARATOR_RE.split(t):
                 part = part.strip()
                 if CLI_FLAG_RE.match(part):
                     flags.append(part)
@@ -485,11 +496,7 @@ def _exists_cwd_or_glob(p: str) -> bool:
         matches = glob(str(Path.cwd() / p))
         return len(matches) > 0
     # If it's a bare filename with extension, search recursively under CWD
-    if re.fullmatch(
-        r"\S+\.(py|md|rst|txt|json|jsonl|toml|yaml|yml|ini|cfg|lock|rs|ts|tsx|js|jsx|sh|bat|conf|mdx)",
-        p,
-        flags=re.IGNORECASE,
-    ):
+    if BARE_FILENAME_RE.fullmatch(p):
         from glob import glob
 
         matches = glob(str(Path.cwd() / "**" / p), recursive=True)
@@ -558,10 +565,10 @@ def rule_merge_opportunities(parsed_parities: ParsedParities) -> List[Message]:
     # Compare Set title IDs only: e.g., [CLI-CTX-DEFAULTs-README] → parts: {CLI, CTX, DEFAULTs, README}
     id_parts: Dict[int, set] = {}
     for sid, block in parsed_parities.sets.items():
-        m = re.search(r"\[(?P<id>[^\]]+)\]", block.title)
+        m = TITLE_ID_RE.search(block.title)
         if not m:
             continue
-        parts = [p.casefold() for p in re.split(r"-+", m.group("id")) if p]
+        parts = [p.casefold() for p in DASHES_RE.split(m.group("id")) if p]
         id_parts[sid] = set(parts)
 
     set_ids = sorted(id_parts.keys())
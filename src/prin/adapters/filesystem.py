@@ -2,16 +2,13 @@ from __future__ import annotations
 
 import functools
 import os
-import re
-from fnmatch import fnmatch
 from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, Iterable
 
 from prin import core
 from prin.binary_detection import is_binary_file
 from prin.core import Entry, NodeKind, SourceAdapter
-from prin.filters import GitIgnoreEngine, extension_match, is_excluded
-from prin.path_classifier import classify_pattern
+from prin.filters import GitIgnoreEngine, compile_pattern, extension_match, is_excluded
 
 if TYPE_CHECKING:
     from prin.cli_common import Context
@@ -290,23 +287,17 @@ class FileSystemSource(SourceAdapter):
             return
 
         # Pattern matching
-        kind = classify_pattern(pattern)
         # For pattern matching, use the same display rules
+        matcher = compile_pattern(pattern)
+        if matcher is None:
+            # Invalid regex matches nothing
+            return
 
         for e in self._walk_dfs(search_root):
             f_abs = Path(str(e.path))
             rel = self._display_rel(f_abs, search_root)
 
-            match = False
-            if kind == "glob":
-                match = fnmatch(rel, pattern)
-            else:
-                try:
-                    match = re.search(pattern, rel) is not None
-                except re.error:
-                    match = False
-
-            if match:
+            if matcher(rel):
                 disp, disp_raw = make_display_path(f_abs)
                 cand = Entry(
                     path=PurePosixPath(disp),
@@ -9,7 +9,6 @@ import re
 import time
 from contextlib import suppress
 from dataclasses import dataclass
-from fnmatch import fnmatch
 from pathlib import Path, PurePosixPath
 from typing import Any, Dict, Iterable, Optional, TypedDict
 from urllib.parse import parse_qs, urlparse
@@ -18,13 +17,21 @@ import requests
 
 from prin.types import Pattern
 
-from ..core import Entry, NodeKind, SourceAdapter, _decode_text, _is_text_bytes
-from ..filters import extension_match, is_excluded
-from ..path_classifier import classify_pattern
+from ..core import (
+    Entry,
+    NodeKind,
+    SourceAdapter,
+    _decode_text,
+    _is_text_bytes,
+    prefetch_in_windows,
+)
+from ..filters import compile_pattern, extension_match, is_excluded
 
 API_BASE = "https://api.github.com"
 MAX_WAIT_SECONDS = 180
 _GET_CACHE_DIR = Path("~/.cache").expanduser() / "prin" / "gh_get"
+# Files are fetched concurrently in windows of this size, ahead of the printer consuming them.
+PREFETCH_WINDOW = 10
 
 
 def _auth_headers() -> Dict[str, str]:
@@ -43,6 +50,27 @@ class GitHubURL(TypedDict):
     ref: Optional[str]
 
 
+# Every URL shape parse_github_url understands, fused into one alternation so a URL is scanned once.
+# The subject is "<host>\x00<rest>", where <rest> is the normalized path after owner/repo.
+# Each form is wrapped in an outer named group (used for dispatch via Match.lastgroup), and may
+# define "<form>_ref" and "<form>_path" groups. Alternatives are tried in order: commit/tree/blob
+# apply to any host, then the host-specific forms, and 'standard' treats everything as a subpath.
+_GITHUB_URL_FORMS_RE = re.compile(
+    r"""
+    ^(?:
+        (?P<commit>[^\x00]*\x00commit/(?P<commit_ref>[^/]+)(?:/.*)?)
+      | (?P<tree>[^\x00]*\x00tree/(?P<tree_ref>[^/]+)(?:/(?P<tree_path>.*))?)
+      | (?P<blob>[^\x00]*\x00blob/(?P<blob_ref>[^/]+)(?:/(?P<blob_path>.*))?)
+      | (?P<contents>api\.github\.com\x00contents(?:/(?P<contents_path>.*))?)
+      | (?P<trees>api\.github\.com\x00git/trees/(?P<trees_ref>[^/]+)(?:/.*)?)
+      | (?P<raw>raw\.githubusercontent\.com\x00(?P<raw_ref>[^/]+)(?:/(?P<raw_path>.*))?)
+      | (?P<standard>[^\x00]*\x00(?P<standard_path>.*))
+    )$
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
 def parse_github_url(url: str) -> GitHubURL:
     """
     Parse a GitHub URL into owner, repo, optional ref, and subpath.
@@ -105,47 +133,21 @@ def parse_github_url(url: str) -> GitHubURL:
     owner, repo = parts[0], parts[1]
     rest = parts[2:]
 
-    ref: str | None = None
-    subpath_parts: list[str] = []
-
-    # Handle special patterns if present
-    if rest[:1] == ["commit"] and len(rest) >= 2:
-        # owner/repo/commit/<sha>
-        ref = rest[1]
-        subpath_parts = []
-    elif rest[:1] == ["tree"] and len(rest) >= 2:
-        # owner/repo/tree/<ref>/optional/sub/path
-        ref = rest[1]
-        subpath_parts = rest[2:]
-    elif rest[:1] == ["blob"] and len(rest) >= 2:
-        # owner/repo/blob/<ref>/file/or/path
-        ref = rest[1]
-        subpath_parts = rest[2:]
-    elif host == "api.github.com" and rest[:1] == ["contents"]:
-        # api.github.com/repos/<owner>/<repo>/contents(/path)? with optional ?ref=
-        subpath_parts = rest[1:]
+    # Dispatch on the single fused pattern; the name of the outermost matched group is the URL form.
+    m = _GITHUB_URL_FORMS_RE.match(f"{host}\x00{'/'.join(rest)}")
+    assert m is not None, "The 'standard' form matches any input"
+    form = m.lastgroup
+    groups = m.groupdict()
+    ref: str | None = groups.get(f"{form}_ref")
+    subpath: str = groups.get(f"{form}_path") or ""
+    if form == "contents":
+        # api.github.com/repos/<owner>/<repo>/contents(/path)? carries its ref in ?ref=
         ref = (query_params.get("ref") or [None])[0]
-    elif host == "api.github.com" and rest[:2] == ["git", "trees"] and len(rest) >= 3:
-        # api.github.com/repos/<owner>/<repo>/git/trees/<ref>
-        ref = rest[2]
-        subpath_parts = []
-    elif host == "raw.githubusercontent.com" and len(rest) >= 1:
-        # raw.githubusercontent.com/<owner>/<repo>/<ref>/<path>
-        if len(rest) >= 1:
-            # For raw, the parts already start after repo; rebuild using parsed host path
-            # Re-parse: owner/repo handled earlier, so rest is [<ref>, path...]
-            # Since we normalized host+path, parts are owner, repo, <ref>, path...
-            # Adjust because earlier split used raw starting after host, so here rest includes ref and subpath
-            ref = rest[0] if rest else None
-            subpath_parts = rest[1:]
-    else:
-        # Treat everything after repo as a subpath. No explicit ref.
-        subpath_parts = rest
 
     data: GitHubURL = {
         "owner": owner,
         "repo": repo,
-        "subpath": "/".join(subpath_parts),
+        "subpath": subpath,
         "ref": ref,
     }
     return data
@@ -240,6 +242,11 @@ def _get(session: requests.Session, url: str, *, params=None) -> requests.Respon
     return resp
 
 
+# git tree entry modes (git/trees API); anything else (symlink 120000, submodule 160000) is OTHER.
+_TREE_MODE_DIRECTORY = "040000"
+_TREE_MODES_FILE = frozenset({"100644", "100755"})
+
+
 @dataclass
 class _Ctx:
     owner: str
@@ -265,12 +272,64 @@ class GitHubRepoSource(SourceAdapter):
         self._exclusions: list[Pattern] = []
         self._extensions: list[Pattern] = []
         self._include_empty: bool = False
+        self._only_headers: bool = False
+        self._max_files: int | None = None
+        # Bytes of the current prefetch window, keyed by repo path. See _with_prefetch.
+        self._blob_cache: dict[str, bytes] = {}
+        # Directory path -> children under the search root, from a single recursive tree listing.
+        # See _load_tree_index.
+        self._dir_index: dict[str, list[Entry]] = {}
+        self._file_paths: set[str] = set()
+        self._tree_index_loaded: bool = False
 
     @functools.lru_cache
     def _fetch_default_branch(self, owner: str, repo: str) -> str:
         r = _get(self._session, f"{API_BASE}/repos/{owner}/{repo}")
         return r.json()["default_branch"]
 
+    def _load_tree_index(self, root: str) -> None:
+        """
+        Index the subtree at `root` by parent directory with one recursive git/trees request, scoped
+        to `root` via the "<ref>:<path>" tree-ish so a small subdirectory doesn't cost the whole repository.
+        Leaves the index empty if the listing is unavailable or truncated by GitHub, in which case
+        list_dir keeps using the per-directory contents API.
+        """
+        self._tree_index_loaded = True
+        owner, repo, ref = self._ctx.owner, self._ctx.repo, self._ctx.ref
+        tree_ish = f"{ref}:{root}" if root else ref
+        try:
+            r = _get(
+                self._session,
+                f"{API_BASE}/repos/{owner}/{repo}/git/trees/{tree_ish}",
+                params={"recursive": "1"},
+            )
+            tree = r.json()
+        except (requests.RequestException, ValueError):
+            return
+        if not isinstance(tree, dict) or tree.get("truncated") or "tree" not in tree:
+            return
+        prefix = f"{root}/" if root else ""
+        dir_index: dict[str, list[Entry]] = {root: []}
+        for item in tree["tree"]:
+            if not item.get("path"):
+                continue
+            it_path = prefix + item["path"]
+            # Classify by mode: git reports symlinks (120000) as "blob" and submodules (160000) as
+            # "commit". The contents API reports those as "symlink"/"submodule", i.e. neither file nor dir.
+            it_mode = item.get("mode")
+            kind = NodeKind.OTHER
+            if it_mode == _TREE_MODE_DIRECTORY:
+                kind = NodeKind.DIRECTORY
+                dir_index.setdefault(it_path, [])
+            elif it_mode in _TREE_MODES_FILE:
+                kind = NodeKind.FILE
+                self._file_paths.add(it_path)
+            parent, _, name = it_path.rpartition("/")
+            dir_index.setdefault(parent, []).append(
+                Entry(path=PurePosixPath(it_path), name=name, kind=kind)
+            )
+        self._dir_index = dir_index
+
     def resolve(self, root_spec: str) -> PurePosixPath:
         # We treat the repo root as empty path
         return PurePosixPath(root_spec or "")
@@ -280,6 +339,8 @@ class GitHubRepoSource(SourceAdapter):
         self._exclusions = ctx.exclusions
         self._extensions = ctx.extensions
         self._include_empty = ctx.include_empty
+        self._only_headers = ctx.only_headers
+        self._max_files = ctx.max_files
 
     def _display_rel(self, path: PurePosixPath, base: PurePosixPath) -> PurePosixPath:
         try:
@@ -289,6 +350,24 @@ class GitHubRepoSource(SourceAdapter):
             return path
 
     def walk_pattern(self, pattern: str, root: str | None) -> Iterable[Entry]:
+        yield from self._with_prefetch(self._walk_pattern(pattern, root))
+
+    def _with_prefetch(self, entries: Iterable[Entry]) -> Iterable[Entry]:
+        """Yield `entries`, fetching each window of printable files concurrently first. See prefetch_in_windows."""
+        if os.getenv("PRIN_GH_MOCK_ROOT") or (self._only_headers and self._include_empty):
+            # Mock reads are local, and headers-only output with empty files included never reads bytes.
+            yield from entries
+            return
+        yield from prefetch_in_windows(
+            entries,
+            self._fetch_file_bytes,
+            wanted=lambda e: e.explicit or self._passes_filters(e),
+            cache=self._blob_cache,
+            window=PREFETCH_WINDOW,
+            limit=self._max_files,
+        )
+
+    def _walk_pattern(self, pattern: str, root: str | None) -> Iterable[Entry]:
         """
         Search for pattern in the given path.
         If search_path is None, use repository root.
@@ -327,22 +406,16 @@ class GitHubRepoSource(SourceAdapter):
             return
 
         # Pattern matching
-        kind = classify_pattern(pattern)
+        matcher = compile_pattern(pattern)
+        if matcher is None:
+            # Invalid regex matches nothing
+            return
 
         for e in self._walk_dfs(search_root):
             f_abs = PurePosixPath(str(e.path))
             rel = self._display_rel(f_abs, search_root)
 
-            match = False
-            if kind == "glob":
-                match = fnmatch(str(rel), pattern)
-            else:
-                try:
-                    match = re.search(pattern, str(rel)) is not None
-                except re.error:
-                    match = False
-
-            if match:
+            if matcher(str(rel)):
                 yield Entry(
                     path=rel,
                     name=e.name,
@@ -393,13 +466,17 @@ class GitHubRepoSource(SourceAdapter):
                     abs_path=PurePosixPath(f.path),
                 )
 
-    def should_print(self, entry: Entry) -> bool:
-        if entry.explicit:
-            return True
+    def _passes_filters(self, entry: Entry) -> bool:
+        """Exclusion and extension filters only; the emptiness check needs the file's bytes."""
         dummy = Entry(path=entry.path, name=entry.name, kind=entry.kind)
         if is_excluded(dummy, exclude=self._exclusions):
             return False
-        if not extension_match(dummy, extensions=self._extensions):
+        return extension_match(dummy, extensions=self._extensions)
+
+    def should_print(self, entry: Entry) -> bool:
+        if entry.explicit:
+            return True
+        if not self._passes_filters(entry):
             return False
         return not (not self._include_empty and self.is_empty(entry.abs_path or entry.path))
 
@@ -434,10 +511,16 @@ class GitHubRepoSource(SourceAdapter):
                     entries.append(Entry(path=rel_path, name=entry.name, kind=kind))
             return entries
 
+        key = "" if path in ("", ".") else path.strip("/")
+        if key in self._dir_index:
+            return list(self._dir_index[key])
+        if key in self._file_paths:
+            raise NotADirectoryError(path or ".")
+
         owner, repo, ref = self._ctx.owner, self._ctx.repo, self._ctx.ref
         url = (
-            f"{API_BASE}/repos/{owner}/{repo}/contents/{path}"
-            if path
+            f"{API_BASE}/repos/{owner}/{repo}/contents/{key}"
+            if key
             else f"{API_BASE}/repos/{owner}/{repo}/contents"
         )
         try:
@@ -468,6 +551,10 @@ class GitHubRepoSource(SourceAdapter):
             elif it_type == "file":
                 kind = NodeKind.FILE
             entries.append(Entry(path=PurePosixPath(it_path), name=it_name, kind=kind))
+        # The first directory listed is the search root (a file root raised above, so it's never
+        # indexed). Index its subtree once, unless there is nothing below it to descend into.
+        if not self._tree_index_loaded and any(e.kind == NodeKind.DIRECTORY for e in entries):
+            self._load_tree_index(key)
         return entries
 
     def read_file_bytes(self, file_path: PurePosixPath) -> bytes:
@@ -481,6 +568,12 @@ class GitHubRepoSource(SourceAdapter):
                 except Exception:
                     pass
 
+        cached = self._blob_cache.get(str(file_path))
+        if cached is not None:
+            return cached
+        return self._fetch_file_bytes(file_path)
+
+    def _fetch_file_bytes(self, file_path: PurePosixPath) -> bytes:
         owner, repo, ref = self._ctx.owner, self._ctx.repo, self._ctx.ref
         # Try contents API first
         file_contents_response = _get(
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import os
 import re
+from collections import Counter
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
@@ -11,12 +13,20 @@ from typing import Any, Iterable
 from urllib.parse import urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from prin.cli_common import Context
 from prin.types import Pattern
 
-from ..core import Entry, NodeKind, SourceAdapter, _decode_text, _is_text_bytes
-from ..filters import extension_match, is_excluded
+from ..core import (
+    Entry,
+    NodeKind,
+    SourceAdapter,
+    _decode_text,
+    _is_text_bytes,
+    prefetch_in_windows,
+)
+from ..filters import compile_pattern, extension_match, is_excluded
 
 
 def _ensure_trailing_slash(url: str) -> str:
@@ -24,6 +34,23 @@ def _ensure_trailing_slash(url: str) -> str:
 
 
 _GET_CACHE_DIR = Path("~/.cache").expanduser() / "prin" / "web_get"
+# Pages are fetched concurrently in windows of this size, ahead of the printer consuming them.
+PREFETCH_WINDOW = 10
+
+
+@functools.cache
+def _session() -> requests.Session:
+    """A process-wide session, so connections (and TLS handshakes) are reused across WebsiteSources."""
+    session = requests.Session()
+    # Pool sized above PREFETCH_WINDOW so concurrent page fetches don't queue for a connection.
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 def _make_hashable(value: Any) -> Any:
@@ -94,10 +121,12 @@ def _get(
     return resp
 
 
+_MD_LINK_RE = re.compile(r"\[[^\]]+\]\(([^)\s]+)\)")
+_RAW_URL_RE = re.compile(r"https?://[^\s)]+")
+
+
 def _parse_llms_txt(text: str) -> list[str]:
     urls: list[str] = []
-    md_link_re = re.compile(r"\[[^\]]+\]\(([^)\s]+)\)")
-    raw_url_re = re.compile(r"https?://[^\s)]+")
 
     for raw in text.splitlines():
         s = raw.strip()
@@ -111,11 +140,11 @@ def _parse_llms_txt(text: str) -> list[str]:
                 s = s[len(prefix) :].strip()
                 break
 
-        m = md_link_re.search(s)
+        m = _MD_LINK_RE.search(s)
         if m:
             urls.append(m.group(1))
             continue
-        m2 = raw_url_re.search(s)
+        m2 = _RAW_URL_RE.search(s)
         if m2:
             urls.append(m2.group(0))
             continue
@@ -139,13 +168,17 @@ class WebsiteSource(SourceAdapter):
     """
 
     def __init__(self, base_url: str, session: requests.Session | None = None) -> None:
-        self._session = session or requests.Session()
+        self._session = session or _session()
         self._ctx: _Ctx | None = None
         self._base_url = base_url
         # Adapter configuration (from Context)
         self._exclusions: list[Pattern] = []
         self._extensions: list[Pattern] = []
         self._include_empty: bool = False
+        self._only_headers: bool = False
+        self._max_files: int | None = None
+        # Bytes of the current prefetch window, keyed by URL key. See walk_pattern.
+        self._blob_cache: dict[str, bytes] = {}
 
     def _ensure_ctx(self) -> _Ctx:
         if self._ctx is not None:
@@ -166,6 +199,7 @@ class WebsiteSource(SourceAdapter):
         # Normalize to absolute URLs; if any entry is relative, resolve against base
         resolved: list[str] = []
         key_to_url: dict[str, str] = {}
+        key_counts: Counter[str] = Counter()
 
         for u in urls:
             abs_u = urljoin(base, u)
@@ -173,9 +207,11 @@ class WebsiteSource(SourceAdapter):
             # Create a stable display key (basename; if empty, use host)
             p = urlparse(abs_u)
             key = Path(p.path.rstrip("/")).name or p.netloc
-            # Deduplicate keys if needed
+            # Deduplicate keys if needed. The n-th repeat of a basename starts probing at .n,
+            # since .2 through .(n-1) are already taken by its earlier repeats.
+            key_counts[key] += 1
             if key in key_to_url:
-                i = 2
+                i = max(2, key_counts[key])
                 while f"{key}.{i}" in key_to_url:
                     i += 1
                 key = f"{key}.{i}"
@@ -194,8 +230,25 @@ class WebsiteSource(SourceAdapter):
         self._exclusions = ctx.exclusions
         self._extensions = ctx.extensions
         self._include_empty = ctx.include_empty
+        self._only_headers = ctx.only_headers
+        self._max_files = ctx.max_files
 
     def walk_pattern(self, pattern: str, root: str | None) -> Iterable[Entry]:
+        entries = self._walk_pattern(pattern, root)
+        if self._only_headers:
+            # Headers-only output never reads page bodies (is_empty is decided without fetching).
+            yield from entries
+            return
+        yield from prefetch_in_windows(
+            entries,
+            self._fetch_bytes,
+            wanted=self.should_print,
+            cache=self._blob_cache,
+            window=PREFETCH_WINDOW,
+            limit=self._max_files,
+        )
+
+    def _walk_pattern(self, pattern: str, root: str | None) -> Iterable[Entry]:
         """
         Search for pattern in the website URLs.
         Pattern matching is applied to the URL keys.
@@ -215,23 +268,13 @@ class WebsiteSource(SourceAdapter):
             return
 
         # Pattern matching on URL keys
-        from ..path_classifier import classify_pattern
-
-        kind = classify_pattern(pattern)
+        matcher = compile_pattern(pattern)
+        if matcher is None:
+            # Invalid regex matches nothing
+            return
 
         for key in sorted(ctx.key_to_url.keys(), key=lambda s: s.casefold()):
-            match = False
-            if kind == "glob":
-                from fnmatch import fnmatch
-
-                match = fnmatch(key, pattern)
-            else:
-                try:
-                    match = re.search(pattern, key) is not None
-                except re.error:
-                    match = False
-
-            if match:
+            if matcher(key):
                 yield Entry(
                     path=PurePosixPath(key),
                     name=key,
@@ -271,6 +314,12 @@ class WebsiteSource(SourceAdapter):
         return entries
 
     def read_file_bytes(self, file_path: PurePosixPath) -> bytes:
+        cached = self._blob_cache.get(str(file_path))
+        if cached is not None:
+            return cached
+        return self._fetch_bytes(file_path)
+
+    def _fetch_bytes(self, file_path: PurePosixPath) -> bytes:
         ctx = self._ensure_ctx()
         key = str(file_path)
         url = ctx.key_to_url.get(key)
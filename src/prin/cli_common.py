@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
 import os
 import sys
 import textwrap
@@ -175,7 +176,9 @@ def _normalize_extension_to_glob(val: TPath | Glob) -> Glob:
     return Glob(f"*.{val}")
 
 
-def parse_common_args(argv: list[str] | None = None) -> Context:
+@functools.cache
+def _parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; parse_args is side-effect free, so it is shared across calls."""
     epilog = textwrap.dedent(
         """
         DEFAULT MATCH CRITERIA
@@ -377,9 +380,13 @@ def parse_common_args(argv: list[str] | None = None) -> Context:
         help="Print files only at this exact depth. Overrides --max-depth and --min-depth.",
     )
 
+    return parser
+
+
+def parse_common_args(argv: list[str] | None = None) -> Context:
     # Expand known alias flags before parsing. If argv is None, use sys.argv[1:].
     effective_argv = _expand_cli_aliases(argv if argv is not None else sys.argv[1:])
-    args = parser.parse_args(effective_argv)
+    args = _parser().parse_args(effective_argv)
 
     return Context(
         pattern=args.pattern,
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import itertools
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path, PurePosixPath
-from typing import TYPE_CHECKING, Iterable, Protocol, Self
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Protocol, Self
 
 from prin.formatters import Formatter, HeaderFormatter
 
@@ -128,6 +131,46 @@ def is_blob_semantically_empty(blob: bytes, file_path: PurePosixPath) -> bool:
     return _is_text_semantically_empty(text)
 
 
+def prefetch_in_windows(
+    entries: Iterable[Entry],
+    fetch: Callable[[PurePosixPath], bytes],
+    *,
+    wanted: Callable[[Entry], bool],
+    cache: dict[str, bytes],
+    window: int = 10,
+    limit: int | None = None,
+) -> Iterator[Entry]:
+    """
+    Yield `entries` unchanged, first fetching the bytes of each window's `wanted` files concurrently into `cache`,
+    keyed by str(abs_path or path). For network adapters whose reads are latency-bound.
+    `cache` holds only the current window: the printer handles a window fully before the next one is pulled,
+    so memory stays bounded.
+    At most `limit` files are prefetched in total (None or non-positive means no limit, as in FileBudget), so a
+    --max-files budget never fetches more files than it can print; files past it are read on demand.
+    Failed fetches are left out of `cache`, so the adapter's regular read retries (and raises) them.
+    """
+    remaining = limit if (isinstance(limit, int) and limit > 0) else None
+    try:
+        with ThreadPoolExecutor(max_workers=window) as pool:
+            for batch in itertools.batched(entries, window):
+                to_fetch = [e for e in batch if e.kind == NodeKind.FILE and wanted(e)]
+                if remaining is not None:
+                    to_fetch = to_fetch[:remaining]
+                    remaining -= len(to_fetch)
+                futures = {
+                    str(e.abs_path or e.path): pool.submit(fetch, e.abs_path or e.path)
+                    for e in to_fetch
+                }
+                cache.clear()
+                for key, future in futures.items():
+                    with suppress(Exception):
+                        cache[key] = future.result()
+                yield from batch
+    finally:
+        # Also when the consumer stops early (e.g. --max-files spent) and the generator is closed.
+        cache.clear()
+
+
 class StdoutWriter(Writer):
     def write(self, text: str) -> None:
         sys.stdout.write(text)
@@ -150,6 +193,10 @@ class StringWriter(Writer):
     def text(self) -> str:
         return "".join(self._parts)
 
+    def reset(self) -> None:
+        """Discard everything written so far, so the instance can be reused."""
+        self._parts.clear()
+
 
 class FileBudget:
     """
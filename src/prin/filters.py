@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+import functools
 import re
 import typing as t
-from fnmatch import fnmatch
+from fnmatch import fnmatch, translate
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, Sequence
+from typing import TYPE_CHECKING, Callable, Sequence
 
 from pathspec.gitignore import GitIgnoreSpec
 
 from .path_classifier import classify_pattern, is_glob
-from .types import Pattern
+from .types import Glob, Pattern
 
 if TYPE_CHECKING:
     from prin.core import Entry
@@ -145,33 +146,55 @@ class GitIgnoreEngine:
         return bool(res.include is False)
 
 
+@functools.lru_cache(maxsize=256, typed=True)
+def compile_pattern(pattern: Pattern) -> Callable[[str], t.Any] | None:
+    """
+    Classify and compile a search pattern once, returning a matcher over relative paths:
+    a full match for globs (as fnmatch), a search for regexes (as re.search). None if it is an invalid regex.
+    """
+    if classify_pattern(pattern) == "glob":
+        return re.compile(translate(t.cast(str, pattern))).match
+    try:
+        return re.compile(pattern).search
+    except re.error:
+        return None
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _compile_exclusion(exclude: Pattern) -> Callable[[str], t.Any] | None:
+    """
+    compile_pattern for exclusions: globs are stripped of surrounding whitespace first, and an
+    invalid regex is logged. Returns a matcher over POSIX paths, or None if it is an invalid regex.
+    typed=True keeps e.g. Glob(".*") and the regex ".*" apart, since they compare equal as strings.
+    """
+    if classify_pattern(exclude) == "glob":
+        # Re-wrapped in Glob so stripping can't change how it classifies.
+        return compile_pattern(Glob(t.cast(str, exclude).strip()))
+
+    # Handle extension excludes like ".py" (treated as text by classifier)
+    # if is_extension(_exclude) and extension_match(entry, extensions=[_exclude]):
+    #     return True
+
+    # regex by default
+    matcher = compile_pattern(exclude)
+    if matcher is None:
+        # Invalid regex: treat as no match (alternatively, raise a CLI error upstream)
+        import logging
+
+        logging.getLogger(__name__).warning(
+            f"[WARNING] [filters.is_excluded] Invalid regex: {exclude!r}"
+        )
+    return matcher
+
+
 def is_excluded(entry: "Entry", *, exclude: Sequence[Pattern]) -> bool:
     path = entry.path
     # Match against full POSIX path only (relative to traversal base)
     target = path.as_posix()
     for _exclude in exclude:
-        kind: Literal["regex", "glob"] = classify_pattern(_exclude)
-        if kind == "glob":
-            if fnmatch(target, t.cast(str, _exclude).strip()):
-                return True
-            continue
-
-        # Handle extension excludes like ".py" (treated as text by classifier)
-        # if is_extension(_exclude) and extension_match(entry, extensions=[_exclude]):
-        #     return True
-
-        # regex by default
-        try:
-            if re.search(_exclude, target):
-                return True
-        except re.error as e:
-            # Invalid regex: treat as no match (alternatively, raise a CLI error upstream)
-            import logging
-
-            logging.getLogger(__name__).warning(
-                f"[WARNING] [filters.is_excluded] Invalid regex: {_exclude!r}: {e}"
-            )
-
+        matcher = _compile_exclusion(_exclude)
+        if matcher is not None and matcher(target):
+            return True
     return False
 
 
@@ -39,6 +39,10 @@ _REGEX_ONLY_PATTERNS = [
 
 _RE_SIGNS: Pattern[str] = re.compile(" | ".join(_REGEX_ONLY_PATTERNS), re.VERBOSE)
 
+# Every pattern above requires at least one of these characters, so a pattern without any of them
+# cannot match _RE_SIGNS and the regex scan can be skipped.
+_RE_SIGN_CHARS = frozenset("^$|{(\\")
+
 
 def classify_pattern(pattern) -> Literal["regex", "glob"]:
     """Return pattern kind: glob if it looks like a glob, else regex by default."""
@@ -54,6 +58,8 @@ def is_regex(pattern) -> TypeIs[TReCompilable]:
         return False
     if not isinstance(pattern, str):
         return False
+    if _RE_SIGN_CHARS.isdisjoint(pattern):
+        return False
     return bool(_RE_SIGNS.search(pattern))
 
 
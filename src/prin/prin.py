@@ -15,7 +15,11 @@ def main(*, argv: list[str] | None = None, writer: Writer | None = None) -> None
     if argv is None:
         argv = sys.argv[1:]
     ctx: Context = cli_common.parse_common_args(argv)
+    run(ctx, writer)
 
+
+def run(ctx: Context, writer: Writer | None = None) -> None:
+    """Print everything `ctx` selects. Lets callers that already hold a Context skip argv parsing."""
     formatter = {"xml": XmlFormatter, "md": MarkdownFormatter}[ctx.tag]()
     out_writer = writer or StdoutWriter()
 
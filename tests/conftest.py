@@ -1,3 +1,4 @@
+import functools
 import os
 import shutil
 import tempfile
@@ -7,7 +8,8 @@ from typing import NamedTuple
 
 import pytest
 
-from tests.utils import write_file
+from prin.core import StringWriter
+from tests.utils import printed_xml_paths, run_prin, write_files
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -23,6 +25,24 @@ def _ensure_github_token():
         os.environ["GITHUB_TOKEN"] = token
 
 
+@functools.cache
+def _ram_backed_tempdir() -> str | None:
+    """
+    Return /dev/shm when it is a usable tmpfs mount, so test trees live in memory; else None (the platform default).
+    Memoized: /proc/mounts is read once per session, not on every prin_tmp_path setup.
+    """
+    shm = Path("/dev/shm")
+    try:
+        mounts = Path("/proc/mounts").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    # /proc/mounts lines: "<device> <mount point> <fs type> <options> <dump> <pass>"
+    is_tmpfs = any(line.split()[1:3] == [str(shm), "tmpfs"] for line in mounts)
+    if is_tmpfs and os.access(shm, os.W_OK | os.X_OK):
+        return str(shm)
+    return None
+
+
 class VFS(NamedTuple):
     root: Path
     paths: list[str]
@@ -58,7 +78,7 @@ def fs_root() -> VFS:
     # Use a neutral temp directory name that won't be excluded by default rules
     # (avoid substrings like "test" or "tests"). Ensure cleanup after the session.
     # Ensure unique non-empty contents across files to avoid incidental substring collisions
-    root = Path(tempfile.mkdtemp(prefix="prinfs_"))
+    root = Path(tempfile.mkdtemp(prefix="prinfs_", dir=_ram_backed_tempdir()))
 
     # Regular files are included by default, regardless of whether they fit one of the (non-exclusion) categories.
     regular_files: dict[str, str] = {
@@ -226,8 +246,7 @@ def fs_root() -> VFS:
         **lock_files,
     }
 
-    for regular_file, content in all_files.items():
-        write_file(root / regular_file, content)
+    write_files(root, all_files)
 
     # Build a traversal-ordered list of file paths and a content mapping
     rel_paths: list[str] = []
@@ -292,13 +311,23 @@ def prin_tmp_path():
     import tempfile
 
     # Equivalent to `mktemp -t prin` - creates temp dir with 'prin' prefix
-    temp_dir = Path(tempfile.mkdtemp(prefix="prin.")).resolve()
+    temp_dir = Path(tempfile.mkdtemp(prefix="prin.", dir=_ram_backed_tempdir())).resolve()
     try:
         yield temp_dir
     finally:
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture
+def writer():
+    """A StringWriter for the test to print into. Its buffer is released on teardown."""
+    string_writer = StringWriter()
+    try:
+        yield string_writer
+    finally:
+        string_writer.reset()
+
+
 def pytest_addoption(parser):
     parser.addoption(
         "--no-network",
@@ -339,6 +368,11 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "repo: tests that target repository adapter")
 
 
+def pytest_sessionfinish(session, exitstatus):
+    run_prin.cache_clear()
+    printed_xml_paths.cache_clear()
+
+
 def pytest_collection_modifyitems(config, items):
     # Handle network skipping first
     if config.getoption("--no-network"):
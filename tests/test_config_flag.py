@@ -2,18 +2,10 @@
 
 from prin.adapters.filesystem import FileSystemSource
 from prin.cli_common import Context, parse_common_args
-from prin.core import DepthFirstPrinter, StringWriter
+from prin.core import DepthFirstPrinter
 from prin.defaults import DEFAULT_CONFIG_EXTENSIONS
 from prin.formatters import XmlFormatter
-
-
-def _run_prin(ctx, root):
-    source = FileSystemSource(anchor=root)
-    source.configure(ctx)
-    writer = StringWriter()
-    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
-    printer.run_pattern("", None, writer)
-    return writer.text()
+from tests.utils import assert_all_in, assert_none_in, printed_xml_paths, run_prin
 
 
 def test_config_included_by_default(fs_root):
@@ -22,9 +14,8 @@ def test_config_included_by_default(fs_root):
     for pattern in DEFAULT_CONFIG_EXTENSIONS:
         assert pattern not in ctx.exclusions
 
-    output = _run_prin(ctx, fs_root.root)
-    for path in fs_root.config_files:
-        assert path in output
+    paths = printed_xml_paths(run_prin(("", str(fs_root.root))))
+    assert_all_in(fs_root.config_files, paths)
 
 
 def test_no_config_flag_excludes_config_files(fs_root):
@@ -33,17 +24,14 @@ def test_no_config_flag_excludes_config_files(fs_root):
     for pattern in DEFAULT_CONFIG_EXTENSIONS:
         assert pattern in ctx.exclusions
 
-    output = _run_prin(ctx, fs_root.root)
-    for path in fs_root.config_files:
-        assert path not in output
+    assert_none_in(fs_root.config_files, run_prin(("--no-config", "", str(fs_root.root))))
 
 
-def test_explicit_config_file_is_included(fs_root):
+def test_explicit_config_file_is_included(fs_root, writer):
     explicit_path = fs_root.root / "config/settings.yaml"
     ctx = Context(no_config=True)
     source = FileSystemSource(anchor=explicit_path)
     source.configure(ctx)
-    writer = StringWriter()
     printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
     printer.run_pattern("", explicit_path, writer)
     output = writer.text()
@@ -57,6 +45,5 @@ def test_no_exclude_overrides_no_config(fs_root):
     assert ctx.no_exclude is True
     assert ctx.exclusions == []
 
-    output = _run_prin(ctx, fs_root.root)
-    for path in fs_root.config_files:
-        assert path in output
+    paths = printed_xml_paths(run_prin(("--no-config", "--no-exclude", "", str(fs_root.root))))
+    assert_all_in(fs_root.config_files, paths)
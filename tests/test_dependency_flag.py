@@ -2,9 +2,10 @@
 
 from prin.adapters.filesystem import FileSystemSource
 from prin.cli_common import Context, parse_common_args
-from prin.core import DepthFirstPrinter, StringWriter
+from prin.core import DepthFirstPrinter
 from prin.defaults import DEFAULT_DEPENDENCY_EXCLUSIONS
 from prin.formatters import XmlFormatter
+from tests.utils import assert_all_in, assert_none_in, printed_xml_paths, run_prin
 
 
 def test_include_dependencies_default(fs_root):
@@ -16,17 +17,17 @@ def test_include_dependencies_default(fs_root):
         assert dep_pattern not in ctx.exclusions
 
     # Run prin and check that dependency spec files are in output
-    source = FileSystemSource(anchor=fs_root.root)
-    source.configure(ctx)
-    writer = StringWriter()
-    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
-    printer.run_pattern("", None, writer)
-    output = writer.text()
+    paths = printed_xml_paths(run_prin(("", str(fs_root.root))))
 
     # Check that some dependency files are present
-    assert "package.json" in output
-    assert "pyproject.toml" in output
-    assert "requirements.txt" in output
+    assert_all_in(
+        [
+            "package.json",
+            "pyproject.toml",
+            "requirements.txt",
+        ],
+        paths,
+    )
 
 
 def test_no_dependencies_flag_excludes_dependency_files(fs_root):
@@ -38,38 +39,32 @@ def test_no_dependencies_flag_excludes_dependency_files(fs_root):
         assert dep_pattern in ctx.exclusions
 
     # Run prin with --no-dependencies
-    source = FileSystemSource(anchor=fs_root.root)
-    source.configure(ctx)
-    writer = StringWriter()
-    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
-    printer.run_pattern("", None, writer)
-    output = writer.text()
+    output = run_prin(("--no-dependencies", "", str(fs_root.root)))
 
     # Check that dependency spec files are excluded
-    assert "package.json" not in output
-    assert "pyproject.toml" not in output
-    assert "requirements.txt" not in output
-    assert "requirements-dev.txt" not in output
-    assert "pom.xml" not in output
-    assert "build.gradle" not in output
-    assert "Cargo.toml" not in output
-    assert "go.mod" not in output
-    assert "Gemfile" not in output
-    assert "composer.json" not in output
-    assert "Podfile" not in output
-    assert "pubspec.yaml" not in output
+    assert_none_in(
+        [
+            "package.json",
+            "pyproject.toml",
+            "requirements.txt",
+            "requirements-dev.txt",
+            "pom.xml",
+            "build.gradle",
+            "Cargo.toml",
+            "go.mod",
+            "Gemfile",
+            "composer.json",
+            "Podfile",
+            "pubspec.yaml",
+        ],
+        output,
+    )
 
 
 def test_no_dependencies_does_not_exclude_lock_files(fs_root):
     """--no-dependencies does not exclude lock files (they have their own flag)."""
     # Run with --no-dependencies but without --include-lock
-    ctx = parse_common_args(["--no-dependencies", "", str(fs_root.root)])
-    source = FileSystemSource(anchor=fs_root.root)
-    source.configure(ctx)
-    writer = StringWriter()
-    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
-    printer.run_pattern("", None, writer)
-    output = writer.text()
+    output = run_prin(("--no-dependencies", "", str(fs_root.root)))
 
     # Lock files should still be excluded by default (not included without --include-lock)
     assert "poetry.lock" not in output
@@ -78,18 +73,18 @@ def test_no_dependencies_does_not_exclude_lock_files(fs_root):
 
 def test_no_dependencies_with_include_lock(fs_root):
     """--no-dependencies with --include-lock includes lock files but not spec files."""
-    ctx = parse_common_args(["--no-dependencies", "--include-lock", "", str(fs_root.root)])
-    source = FileSystemSource(anchor=fs_root.root)
-    source.configure(ctx)
-    writer = StringWriter()
-    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
-    printer.run_pattern("", None, writer)
-    output = writer.text()
+    output = run_prin(("--no-dependencies", "--include-lock", "", str(fs_root.root)))
+    paths = printed_xml_paths(output)
 
     # Lock files should be included
-    assert "poetry.lock" in output
-    assert "package-lock.json" in output
-    assert "uv.lock" in output
+    assert_all_in(
+        [
+            "poetry.lock",
+            "package-lock.json",
+            "uv.lock",
+        ],
+        paths,
+    )
 
     # Spec files should still be excluded
     assert "package.json" not in output
@@ -98,27 +93,25 @@ def test_no_dependencies_with_include_lock(fs_root):
 
 def test_no_dependencies_does_not_exclude_regular_files(fs_root):
     """--no-dependencies does not exclude regular code files."""
-    ctx = parse_common_args(["--no-dependencies", "", str(fs_root.root)])
-    source = FileSystemSource(anchor=fs_root.root)
-    source.configure(ctx)
-    writer = StringWriter()
-    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
-    printer.run_pattern("", None, writer)
-    output = writer.text()
+    paths = printed_xml_paths(run_prin(("--no-dependencies", "", str(fs_root.root))))
 
     # Regular files should still be present
-    assert "foo.py" in output
-    assert "src/app.py" in output
-    assert "src/util.py" in output
+    assert_all_in(
+        [
+            "foo.py",
+            "src/app.py",
+            "src/util.py",
+        ],
+        paths,
+    )
 
 
-def test_explicit_dependency_file_included(fs_root):
+def test_explicit_dependency_file_included(fs_root, writer):
     """Explicitly specified dependency file is included even with --no-dependencies."""
     package_json = fs_root.root / "package.json"
     ctx = Context(include_dependencies=False)
     source = FileSystemSource(anchor=package_json)
     source.configure(ctx)
-    writer = StringWriter()
     printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
     printer.run_pattern("", package_json, writer)
     output = writer.text()
@@ -130,15 +123,16 @@ def test_explicit_dependency_file_included(fs_root):
 
 def test_no_exclude_overrides_no_dependencies(fs_root):
     """--no-exclude / --include-all overrides --no-dependencies."""
-    ctx = parse_common_args(["--no-dependencies", "--no-exclude", "", str(fs_root.root)])
-    source = FileSystemSource(anchor=fs_root.root)
-    source.configure(ctx)
-    writer = StringWriter()
-    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
-    printer.run_pattern("", None, writer)
-    output = writer.text()
+    paths = printed_xml_paths(
+        run_prin(("--no-dependencies", "--no-exclude", "", str(fs_root.root)))
+    )
 
     # Everything should be included
-    assert "package.json" in output
-    assert "pyproject.toml" in output
-    assert "requirements.txt" in output
+    assert_all_in(
+        [
+            "package.json",
+            "pyproject.toml",
+            "requirements.txt",
+        ],
+        paths,
+    )
@@ -4,9 +4,9 @@ import pytest
 
 from prin.adapters.filesystem import FileSystemSource
 from prin.cli_common import Context, parse_common_args
-from prin.core import DepthFirstPrinter, StringWriter
+from prin.core import DepthFirstPrinter
 from prin.formatters import HeaderFormatter
-from tests.utils import write_file
+from tests.utils import write_files
 
 
 @pytest.fixture
@@ -29,25 +29,29 @@ def depth_tree(prin_tmp_path):
           fileB.txt      # depth 3
     """
     root = prin_tmp_path
-    write_file(root / "file0.txt", "depth 1\n")
-    write_file(root / "dir1" / "file1.txt", "depth 2 in dir1\n")
-    write_file(root / "dir1" / "dir2" / "file2.txt", "depth 3 in dir2\n")
-    write_file(root / "dir1" / "dir2" / "dir3" / "file3.txt", "depth 4 in dir3\n")
-    write_file(root / "dirA" / "fileA.txt", "depth 2 in dirA\n")
-    write_file(root / "dirA" / "dirB" / "fileB.txt", "depth 3 in dirB\n")
+    write_files(
+        root,
+        {
+            "file0.txt": "depth 1\n",
+            "dir1/file1.txt": "depth 2 in dir1\n",
+            "dir1/dir2/file2.txt": "depth 3 in dir2\n",
+            "dir1/dir2/dir3/file3.txt": "depth 4 in dir3\n",
+            "dirA/fileA.txt": "depth 2 in dirA\n",
+            "dirA/dirB/fileB.txt": "depth 3 in dirB\n",
+        },
+    )
     return root
 
 
 class TestMaxDepth:
     """Test --max-depth functionality."""
 
-    def test_max_depth_1(self, depth_tree):
+    def test_max_depth_1(self, depth_tree, writer):
         """With --max-depth 1, only files at depth 1 should be included."""
         ctx = Context(max_depth=1)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -59,13 +63,12 @@ class TestMaxDepth:
         assert "fileA.txt" not in output
         assert "fileB.txt" not in output
 
-    def test_max_depth_2(self, depth_tree):
+    def test_max_depth_2(self, depth_tree, writer):
         """With --max-depth 2, only files at depth 1 and 2 should be included."""
         ctx = Context(max_depth=2)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -77,13 +80,12 @@ class TestMaxDepth:
         assert "file3.txt" not in output
         assert "fileB.txt" not in output
 
-    def test_max_depth_3(self, depth_tree):
+    def test_max_depth_3(self, depth_tree, writer):
         """With --max-depth 3, files at depth 1, 2, and 3 should be included."""
         ctx = Context(max_depth=3)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -95,13 +97,12 @@ class TestMaxDepth:
         assert "fileB.txt" in output
         assert "file3.txt" not in output
 
-    def test_max_depth_unlimited(self, depth_tree):
+    def test_max_depth_unlimited(self, depth_tree, writer):
         """With no --max-depth, all files should be included."""
         ctx = Context(max_depth=None)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -117,13 +118,12 @@ class TestMaxDepth:
 class TestMinDepth:
     """Test --min-depth functionality."""
 
-    def test_min_depth_1(self, depth_tree):
+    def test_min_depth_1(self, depth_tree, writer):
         """With --min-depth 1, all files should be included (default behavior)."""
         ctx = Context(min_depth=1)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -133,13 +133,12 @@ class TestMinDepth:
         assert "file2.txt" in output
         assert "file3.txt" in output
 
-    def test_min_depth_2(self, depth_tree):
+    def test_min_depth_2(self, depth_tree, writer):
         """With --min-depth 2, only files at depth 2+ should be included."""
         ctx = Context(min_depth=2)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -151,13 +150,12 @@ class TestMinDepth:
         assert "file3.txt" in output
         assert "fileB.txt" in output
 
-    def test_min_depth_3(self, depth_tree):
+    def test_min_depth_3(self, depth_tree, writer):
         """With --min-depth 3, only files at depth 3+ should be included."""
         ctx = Context(min_depth=3)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -169,13 +167,12 @@ class TestMinDepth:
         assert "fileB.txt" in output
         assert "file3.txt" in output
 
-    def test_min_depth_4(self, depth_tree):
+    def test_min_depth_4(self, depth_tree, writer):
         """With --min-depth 4, only files at depth 4+ should be included."""
         ctx = Context(min_depth=4)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -191,13 +188,12 @@ class TestMinDepth:
 class TestExactDepth:
     """Test --exact-depth functionality."""
 
-    def test_exact_depth_1(self, depth_tree):
+    def test_exact_depth_1(self, depth_tree, writer):
         """With --exact-depth 1, only files at exactly depth 1 should be included."""
         ctx = Context(exact_depth=1)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -207,13 +203,12 @@ class TestExactDepth:
         assert "fileA.txt" not in output
         assert "file2.txt" not in output
 
-    def test_exact_depth_2(self, depth_tree):
+    def test_exact_depth_2(self, depth_tree, writer):
         """With --exact-depth 2, only files at exactly depth 2 should be included."""
         ctx = Context(exact_depth=2)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -224,13 +219,12 @@ class TestExactDepth:
         assert "file2.txt" not in output
         assert "fileB.txt" not in output
 
-    def test_exact_depth_3(self, depth_tree):
+    def test_exact_depth_3(self, depth_tree, writer):
         """With --exact-depth 3, only files at exactly depth 3 should be included."""
         ctx = Context(exact_depth=3)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -242,13 +236,12 @@ class TestExactDepth:
         assert "fileB.txt" in output
         assert "file3.txt" not in output
 
-    def test_exact_depth_overrides_min_max(self, depth_tree):
+    def test_exact_depth_overrides_min_max(self, depth_tree, writer):
         """--exact-depth should override --min-depth and --max-depth."""
         ctx = Context(exact_depth=2, min_depth=1, max_depth=4)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -263,13 +256,12 @@ class TestExactDepth:
 class TestCombinedDepthControls:
     """Test combinations of min and max depth."""
 
-    def test_min_2_max_3(self, depth_tree):
+    def test_min_2_max_3(self, depth_tree, writer):
         """With --min-depth 2 --max-depth 3, only files at depth 2 and 3 should be included."""
         ctx = Context(min_depth=2, max_depth=3)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -281,13 +273,12 @@ class TestCombinedDepthControls:
         assert "fileB.txt" in output
         assert "file3.txt" not in output
 
-    def test_min_3_max_3(self, depth_tree):
+    def test_min_3_max_3(self, depth_tree, writer):
         """With --min-depth 3 --max-depth 3, only files at exactly depth 3 (same as exact-depth 3)."""
         ctx = Context(min_depth=3, max_depth=3)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("", None, writer)
 
@@ -334,13 +325,12 @@ class TestCLIDepthParsing:
 class TestDepthWithPatterns:
     """Test depth controls with pattern matching."""
 
-    def test_max_depth_with_pattern(self, depth_tree):
+    def test_max_depth_with_pattern(self, depth_tree, writer):
         """Depth controls should work with pattern matching."""
         ctx = Context(max_depth=2)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         printer.run_pattern("*.txt", None, writer)
 
@@ -352,13 +342,12 @@ class TestDepthWithPatterns:
         assert "file2.txt" not in output
         assert "file3.txt" not in output
 
-    def test_exact_depth_with_pattern(self, depth_tree):
+    def test_exact_depth_with_pattern(self, depth_tree, writer):
         """Exact depth with pattern should only match at specified depth."""
         ctx = Context(exact_depth=3)
         source = FileSystemSource(anchor=depth_tree)
         source.configure(ctx)
 
-        writer = StringWriter()
         printer = DepthFirstPrinter(source, HeaderFormatter(), ctx)
         # Use regex pattern that matches filenames containing 'file' or 'B'
         printer.run_pattern(".*file.*\\.txt$|.*B\\.txt$", None, writer)
@@ -0,0 +1,170 @@
+"""Tests for GitHubRepoSource listing through the recursive git/trees index, against a fake session."""
+
+import base64
+from pathlib import PurePosixPath
+
+import pytest
+
+from prin.adapters import github
+from prin.adapters.github import API_BASE, GitHubRepoSource
+from prin.cli_common import Context
+from prin.core import DepthFirstPrinter, FileBudget, StringWriter
+from prin.formatters import XmlFormatter
+from tests.utils import FakeSession
+
+REPO_URL = "https://github.com/owner/repo/tree/main"
+TREES_URL = f"{API_BASE}/repos/owner/repo/git/trees/main"
+CONTENTS_URL = f"{API_BASE}/repos/owner/repo/contents"
+
+
+def _contents(text: str) -> dict:
+    return {
+        "type": "file",
+        "encoding": "base64",
+        "content": base64.b64encode(text.encode()).decode(),
+    }
+
+
+def _listing_item(path: str, type_: str) -> dict:
+    return {"path": path, "name": path.rpartition("/")[2], "type": type_}
+
+
+def _tree_item(path: str, mode: str, type_: str) -> dict:
+    return {"path": path, "mode": mode, "type": type_}
+
+
+FILE_ROUTES = {
+    f"{CONTENTS_URL}/main.py": _contents("print('main')\n"),
+    f"{CONTENTS_URL}/src/app.py": _contents("def app():\n    return 1\n"),
+    f"{CONTENTS_URL}/src/lib/util.py": _contents("def util():\n    pass\n"),
+}
+
+LISTINGS = {
+    CONTENTS_URL: [_listing_item("main.py", "file"), _listing_item("src", "dir")],
+    f"{CONTENTS_URL}/src": [
+        _listing_item("src/app.py", "file"),
+        _listing_item("src/link.py", "symlink"),
+        _listing_item("src/vendored", "submodule"),
+        _listing_item("src/lib", "dir"),
+    ],
+    f"{CONTENTS_URL}/src/lib": [_listing_item("src/lib/util.py", "file")],
+}
+
+SRC_TREE_ITEMS = [
+    _tree_item("app.py", "100644", "blob"),
+    _tree_item("link.py", "120000", "blob"),
+    _tree_item("vendored", "160000", "commit"),
+    _tree_item("lib", "040000", "tree"),
+    _tree_item("lib/util.py", "100755", "blob"),
+]
+
+TREE = {
+    "truncated": False,
+    "tree": [
+        _tree_item("main.py", "100644", "blob"),
+        _tree_item("src", "040000", "tree"),
+        *({**item, "path": f"src/{item['path']}"} for item in SRC_TREE_ITEMS),
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def _isolated_gh_cache(prin_tmp_path, monkeypatch):
+    monkeypatch.setattr(github, "_GET_CACHE_DIR", prin_tmp_path / "gh_get")
+    monkeypatch.delenv("PRIN_GH_MOCK_ROOT", raising=False)
+
+
+def _print_repo(session: FakeSession, ctx: Context | None = None, url: str = REPO_URL) -> str:
+    ctx = ctx or Context()
+    source = GitHubRepoSource(url, session=session)
+    writer = StringWriter()
+    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
+    printer.run_pattern("", url, writer, budget=FileBudget(ctx.max_files))
+    return writer.text()
+
+
+def test_tree_index_skips_symlinks_and_submodules():
+    session = FakeSession({TREES_URL: TREE, **LISTINGS, **FILE_ROUTES})
+    output = _print_repo(session)
+    assert "<main.py>" in output
+    assert "<src/app.py>" in output
+    assert "<src/lib/util.py>" in output
+    assert "link.py" not in output
+    assert "vendored" not in output
+    assert session.calls.count(TREES_URL) == 1
+    # Below the root, listing comes from the tree index alone: no per-directory contents requests.
+    assert f"{CONTENTS_URL}/src" not in session.calls
+    assert f"{CONTENTS_URL}/src/lib" not in session.calls
+
+
+def test_tree_index_is_scoped_to_search_root():
+    src_tree = {"truncated": False, "tree": SRC_TREE_ITEMS}
+    session = FakeSession({f"{TREES_URL}:src": src_tree, **LISTINGS, **FILE_ROUTES})
+    output = _print_repo(session, url=f"{REPO_URL}/src")
+    assert "<app.py>" in output
+    assert "<lib/util.py>" in output
+    assert "link.py" not in output
+    assert TREES_URL not in session.calls
+    assert f"{CONTENTS_URL}/src/lib" not in session.calls
+
+
+def test_blob_url_never_requests_tree():
+    session = FakeSession({TREES_URL: TREE, **LISTINGS, **FILE_ROUTES})
+    output = _print_repo(session, url="https://github.com/owner/repo/blob/main/src/app.py")
+    assert "return 1" in output
+    assert not [c for c in session.calls if c.startswith(TREES_URL)]
+
+
+@pytest.mark.parametrize(
+    "tree_route",
+    [{**TREE, "truncated": True}, 500],
+    ids=["truncated", "request-failure"],
+)
+def test_list_dir_falls_back_to_contents_api(tree_route):
+    session = FakeSession({TREES_URL: tree_route, **LISTINGS, **FILE_ROUTES})
+    output = _print_repo(session)
+    assert "<main.py>" in output
+    assert "<src/app.py>" in output
+    assert "<src/lib/util.py>" in output
+    assert "link.py" not in output
+    assert f"{CONTENTS_URL}/src" in session.calls
+    assert f"{CONTENTS_URL}/src/lib" in session.calls
+
+
+def test_list_dir_distinguishes_files_dirs_and_missing_paths():
+    session = FakeSession({TREES_URL: TREE, **LISTINGS})
+    source = GitHubRepoSource(REPO_URL, session=session)
+    assert {e.name for e in source.list_dir(PurePosixPath())} == {"main.py", "src"}
+    assert {e.name for e in source.list_dir(PurePosixPath("src"))} == {
+        "app.py",
+        "link.py",
+        "vendored",
+        "lib",
+    }
+    with pytest.raises(NotADirectoryError):
+        source.list_dir(PurePosixPath("src/app.py"))
+    with pytest.raises(FileNotFoundError):
+        source.list_dir(PurePosixPath("nope"))
+    assert session.calls == [CONTENTS_URL, TREES_URL, f"{CONTENTS_URL}/nope"]
+
+
+FLAT_LISTING = [_listing_item(f"f{i}.py", "file") for i in range(5)]
+FLAT_ROUTES = {f"{CONTENTS_URL}/f{i}.py": _contents(f"x = {i}\n") for i in range(5)}
+
+
+def test_prefetch_fetches_each_printed_file_once():
+    session = FakeSession({CONTENTS_URL: FLAT_LISTING, **FLAT_ROUTES})
+    output = _print_repo(session)
+    assert all(f"<f{i}.py>" in output for i in range(5))
+    # A root without subdirectories is not indexed, and prefetched bytes are served from the
+    # window cache: reads do not request the file again.
+    assert session.calls[0] == CONTENTS_URL
+    assert sorted(session.calls[1:]) == sorted(FLAT_ROUTES)
+
+
+def test_prefetch_respects_max_files():
+    session = FakeSession({CONTENTS_URL: FLAT_LISTING, **FLAT_ROUTES})
+    output = _print_repo(session, Context(max_files=1))
+    assert "<f0.py>" in output
+    assert "<f1.py>" not in output
+    assert session.calls == [CONTENTS_URL, f"{CONTENTS_URL}/f0.py"]
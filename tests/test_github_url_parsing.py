@@ -0,0 +1,85 @@
+"""Tests for parse_github_url across every supported URL form and cosmetic variation."""
+
+import pytest
+
+from prin.adapters.github import parse_github_url
+
+OWNER = "TypingMind"
+REPO = "awesome-typingmind"
+
+# key -> (url without scheme, expected subpath, expected ref)
+_REAL_URLS: dict[str, tuple[str, str, str | None]] = {
+    "standard": (f"github.com/{OWNER}/{REPO}", "", None),
+    "standard_subpath": (f"github.com/{OWNER}/{REPO}/logos", "logos", None),
+    "tree": (f"github.com/{OWNER}/{REPO}/tree/main", "", "main"),
+    "tree_subpath": (f"github.com/{OWNER}/{REPO}/tree/main/logos/x", "logos/x", "main"),
+    "blob": (f"github.com/{OWNER}/{REPO}/blob/v1.0/README.md", "README.md", "v1.0"),
+    "commit": (f"github.com/{OWNER}/{REPO}/commit/d34db33f", "", "d34db33f"),
+    "api_repo": (f"api.github.com/repos/{OWNER}/{REPO}", "", None),
+    "api_contents": (f"api.github.com/repos/{OWNER}/{REPO}/contents/logos", "logos", None),
+    "api_trees": (f"api.github.com/repos/{OWNER}/{REPO}/git/trees/d34db33f", "", "d34db33f"),
+    "raw": (
+        f"raw.githubusercontent.com/{OWNER}/{REPO}/main/logos/README.md",
+        "logos/README.md",
+        "main",
+    ),
+}
+
+# Each bit toggles one cosmetic variation that must not affect the parse result.
+_MODIFIERS = ("https://", "www.", "/", ".git", "  ")
+
+
+def _apply_modifiers(url: str, mod_bits: int) -> str | None:
+    scheme, www, trailing_slash, dot_git, whitespace = (
+        _MODIFIERS[i] if mod_bits & (1 << i) else "" for i in range(len(_MODIFIERS))
+    )
+    if www and not url.startswith("github.com/"):
+        return None
+    return f"{whitespace}{scheme}{www}{url}{trailing_slash}{dot_git}{whitespace}"
+
+
+def _generate_urls() -> tuple[tuple[tuple[str, dict], ...], tuple[str, ...]]:
+    """Return the (url, expected) cases and their compact ids, e.g. 'tree:01001'."""
+    cases = []
+    ids = []
+    for real_key, (url, subpath, ref) in _REAL_URLS.items():
+        expected = {"owner": OWNER, "repo": REPO, "subpath": subpath, "ref": ref}
+        for mod_bits in range(1 << len(_MODIFIERS)):
+            modified = _apply_modifiers(url, mod_bits)
+            if modified is not None:
+                cases.append((modified, expected))
+                ids.append(f"{real_key}:{mod_bits:05b}")
+    return tuple(cases), tuple(ids)
+
+
+_URLS, _IDS = _generate_urls()
+
+
+@pytest.mark.parametrize(("url", "exp"), _URLS, ids=_IDS)
+def test_parse_github_url_combinatorics(url, exp):
+    assert parse_github_url(url) == exp
+
+
+def test_parse_github_url_api_contents_ref_from_query():
+    url = f"https://api.github.com/repos/{OWNER}/{REPO}/contents/logos/README.md?ref=dev"
+    assert parse_github_url(url) == {
+        "owner": OWNER,
+        "repo": REPO,
+        "subpath": "logos/README.md",
+        "ref": "dev",
+    }
+
+
+def test_parse_github_url_ssh():
+    assert parse_github_url(f"git@github.com:{OWNER}/{REPO}.git") == {
+        "owner": OWNER,
+        "repo": REPO,
+        "subpath": "",
+        "ref": None,
+    }
+
+
+@pytest.mark.parametrize("url", ["https://github.com/", "https://github.com/TypingMind"])
+def test_parse_github_url_rejects_missing_repo(url):
+    with pytest.raises(ValueError, match="Unrecognized GitHub URL"):
+        parse_github_url(url)
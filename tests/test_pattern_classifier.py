@@ -0,0 +1,55 @@
+"""Tests for path_classifier.classify_pattern across regex signs, globs and nominal pattern types."""
+
+import re
+
+import pytest
+
+from prin.path_classifier import classify_pattern
+from prin.types import Glob, TReCompilable
+
+REGEX_CASES = [
+    "^foo",
+    "foo$",
+    "foo|bar",
+    "a{2}",
+    "a{2,}",
+    "a{,3}",
+    "a{2,3}",
+    "(?i)foo",
+    "(?:foo)",
+    r"(a)\1",
+    r"\d+",
+    r"\bfoo",
+    r"\p{L}",
+    r"foo\.py",
+    r"a\|b",
+    "(foo|bar).py",
+    # A bare token with no glob characters is matched as a regex by default.
+    "foo",
+    "src/app.py",
+    ".env",
+    TReCompilable("*.py"),
+    re.compile(r"\.py$"),
+]
+
+GLOB_CASES = [
+    "*.py",
+    "src/*.py",
+    "file?.txt",
+    "[abc].md",
+    "**/x",
+    # No regex signs, so the '*' makes it a glob.
+    ".*",
+    Glob(".*"),
+    Glob("foo"),
+]
+
+
+@pytest.mark.parametrize("pattern", REGEX_CASES, ids=repr)
+def test_classify_pattern_regex(pattern):
+    assert classify_pattern(pattern) == "regex"
+
+
+@pytest.mark.parametrize("pattern", GLOB_CASES, ids=repr)
+def test_classify_pattern_glob(pattern):
+    assert classify_pattern(pattern) == "glob"
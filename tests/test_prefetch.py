@@ -0,0 +1,82 @@
+"""Tests for core.prefetch_in_windows: ordering, filtering, failure handling, window-bounded cache and limit."""
+
+from pathlib import PurePosixPath
+
+import pytest
+
+from prin.core import Entry, NodeKind, prefetch_in_windows
+
+
+def _entries(*names: str) -> list[Entry]:
+    kinds = {"dir": NodeKind.DIRECTORY}
+    return [Entry(path=PurePosixPath(n), name=n, kind=kinds.get(n, NodeKind.FILE)) for n in names]
+
+
+class _Fetcher:
+    def __init__(self, failing: frozenset[str] = frozenset()) -> None:
+        self.failing = failing
+        self.fetched: list[str] = []
+
+    def __call__(self, path: PurePosixPath) -> bytes:
+        self.fetched.append(str(path))
+        if str(path) in self.failing:
+            raise OSError(str(path))
+        return f"<{path}>".encode()
+
+
+def test_yields_entries_unchanged_and_in_order():
+    entries = _entries("a", "dir", "b", "c", "d", "e")
+    out = list(prefetch_in_windows(entries, _Fetcher(), wanted=lambda e: True, cache={}, window=2))
+    assert out == entries
+
+
+def test_fetches_only_wanted_files():
+    fetch = _Fetcher()
+    entries = _entries("keep1", "dir", "skip", "keep2")
+    list(prefetch_in_windows(entries, fetch, wanted=lambda e: e.name != "skip", cache={}, window=3))
+    assert sorted(fetch.fetched) == ["keep1", "keep2"]
+
+
+def test_failed_fetch_stays_out_of_cache():
+    cache: dict[str, bytes] = {}
+    seen: dict[str, dict[str, bytes]] = {}
+    entries = _entries("ok", "bad")
+    fetch = _Fetcher(failing=frozenset({"bad"}))
+    for e in prefetch_in_windows(entries, fetch, wanted=lambda e: True, cache=cache, window=2):
+        seen[e.name] = dict(cache)
+    assert seen["bad"] == {"ok": b"<ok>"}
+
+
+def test_cache_holds_current_window_only():
+    cache: dict[str, bytes] = {}
+    seen: dict[str, set[str]] = {}
+    entries = _entries("a", "b", "c", "d", "e")
+    for e in prefetch_in_windows(entries, _Fetcher(), wanted=lambda e: True, cache=cache, window=2):
+        seen[e.name] = set(cache)
+    assert seen == {"a": {"a", "b"}, "b": {"a", "b"}, "c": {"c", "d"}, "d": {"c", "d"}, "e": {"e"}}
+    assert cache == {}
+
+
+@pytest.mark.parametrize(
+    ("limit", "expected"),
+    [(1, ["a"]), (3, ["a", "b", "c"]), (None, list("abcde")), (0, list("abcde"))],
+)
+def test_limit_caps_total_fetches(limit, expected):
+    fetch = _Fetcher()
+    entries = _entries(*"abcde")
+    out = list(
+        prefetch_in_windows(entries, fetch, wanted=lambda e: True, cache={}, window=2, limit=limit)
+    )
+    assert out == entries
+    assert sorted(fetch.fetched) == expected
+
+
+def test_cache_is_cleared_when_consumer_stops_early():
+    cache: dict[str, bytes] = {}
+    gen = prefetch_in_windows(
+        _entries("a", "b", "c"), _Fetcher(), wanted=lambda e: True, cache=cache, window=2
+    )
+    next(gen)
+    assert cache
+    gen.close()
+    assert cache == {}
@@ -0,0 +1,27 @@
+"""Tests for prin.run, the entry point for callers that already hold a Context."""
+
+from prin.cli_common import Context
+from prin.core import StringWriter
+from prin.prin import main, run
+from tests.utils import assert_all_in, assert_none_in, printed_xml_paths
+
+
+def test_run_prints_context_paths(fs_root, writer, monkeypatch):
+    monkeypatch.chdir(fs_root.root)
+    run(Context(paths=["."]), writer)
+    output = writer.text()
+
+    # Paths display relative to the given "." root.
+    assert_all_in([f"./{path}" for path in fs_root.regular_files], printed_xml_paths(output))
+    assert "def app():" in output
+    assert_none_in(fs_root.lock_files, output)
+
+
+def test_run_matches_main_with_equivalent_argv(fs_root, writer):
+    run(Context(paths=[str(fs_root.root)], tag="md", max_files=3), writer)
+
+    via_argv = StringWriter()
+    main(argv=["--tag", "md", "--max-files", "3", "", str(fs_root.root)], writer=via_argv)
+
+    assert writer.text() == via_argv.text()
+    assert writer.text().count("## FILE: ") == 3
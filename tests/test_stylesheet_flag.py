@@ -2,18 +2,10 @@
 
 from prin.adapters.filesystem import FileSystemSource
 from prin.cli_common import Context, parse_common_args
-from prin.core import DepthFirstPrinter, StringWriter
+from prin.core import DepthFirstPrinter
 from prin.defaults import DEFAULT_STYLESHEET_EXTENSIONS
 from prin.formatters import XmlFormatter
-
-
-def _run_prin(ctx, root):
-    source = FileSystemSource(anchor=root)
-    source.configure(ctx)
-    writer = StringWriter()
-    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
-    printer.run_pattern("", None, writer)
-    return writer.text()
+from tests.utils import assert_none_in, printed_xml_paths, run_prin
 
 
 def test_stylesheets_included_by_default(fs_root):
@@ -22,10 +14,10 @@ def test_stylesheets_included_by_default(fs_root):
     for pattern in DEFAULT_STYLESHEET_EXTENSIONS:
         assert pattern not in ctx.exclusions
 
-    output = _run_prin(ctx, fs_root.root)
-    assert "assets/styles/main.css" in output
-    assert "assets/styles/theme.scss" in output
-    assert "assets/styles/legacy.sass" in output
+    paths = printed_xml_paths(run_prin(("", str(fs_root.root))))
+    assert "assets/styles/main.css" in paths
+    assert "assets/styles/theme.scss" in paths
+    assert "assets/styles/legacy.sass" in paths
 
 
 def test_no_style_flag_excludes_stylesheets(fs_root):
@@ -34,9 +26,7 @@ def test_no_style_flag_excludes_stylesheets(fs_root):
     for pattern in DEFAULT_STYLESHEET_EXTENSIONS:
         assert pattern in ctx.exclusions
 
-    output = _run_prin(ctx, fs_root.root)
-    for path in fs_root.stylesheet_files:
-        assert path not in output
+    assert_none_in(fs_root.stylesheet_files, run_prin(("--no-style", "", str(fs_root.root))))
 
 
 def test_no_css_alias_matches_no_style(fs_root):
@@ -47,12 +37,11 @@ def test_no_css_alias_matches_no_style(fs_root):
     assert ctx_alias.exclusions == ctx_flag.exclusions
 
 
-def test_explicit_stylesheet_is_included(fs_root):
+def test_explicit_stylesheet_is_included(fs_root, writer):
     explicit_path = fs_root.root / "assets/styles/main.css"
     ctx = Context(no_stylesheets=True)
     source = FileSystemSource(anchor=explicit_path)
     source.configure(ctx)
-    writer = StringWriter()
     printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
     printer.run_pattern("", explicit_path, writer)
     output = writer.text()
@@ -66,6 +55,6 @@ def test_no_exclude_overrides_no_style(fs_root):
     assert ctx.no_exclude is True
     assert ctx.exclusions == []
 
-    output = _run_prin(ctx, fs_root.root)
-    assert "assets/styles/main.css" in output
-    assert "assets/styles/custom.pcss" in output
+    paths = printed_xml_paths(run_prin(("--no-style", "--no-exclude", "", str(fs_root.root))))
+    assert "assets/styles/main.css" in paths
+    assert "assets/styles/custom.pcss" in paths
@@ -0,0 +1,105 @@
+"""Tests for WebsiteSource printing llms.txt pages through the prefetch window, against a fake session."""
+
+import pytest
+import requests
+
+from prin.adapters import website
+from prin.adapters.website import WebsiteSource
+from prin.cli_common import Context
+from prin.core import DepthFirstPrinter, FileBudget, StringWriter
+from prin.formatters import XmlFormatter
+from tests.utils import FakeSession
+
+BASE_URL = "https://docs.example.com/"
+LLMS_TXT = """# Example docs
+- [Zeta](https://docs.example.com/zeta.md)
+- [alpha](https://docs.example.com/alpha.md)
+- [Beta](https://docs.example.com/Beta.md)
+"""
+PAGES = {
+    f"{BASE_URL}zeta.md": "zeta page\n",
+    f"{BASE_URL}alpha.md": "alpha page\n",
+    f"{BASE_URL}Beta.md": "beta page\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def _isolated_web_cache(prin_tmp_path, monkeypatch):
+    monkeypatch.setattr(website, "_GET_CACHE_DIR", prin_tmp_path / "web_get")
+    monkeypatch.setenv("PRIN_DISABLE_WEB_CACHE", "1")
+
+
+def _print_site(session: FakeSession, ctx: Context | None = None) -> str:
+    ctx = ctx or Context()
+    source = WebsiteSource(BASE_URL, session=session)
+    writer = StringWriter()
+    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
+    printer.run_pattern("", BASE_URL, writer, budget=FileBudget(ctx.max_files))
+    return writer.text()
+
+
+def test_pages_print_in_key_order_and_are_fetched_once():
+    session = FakeSession({f"{BASE_URL}llms.txt": LLMS_TXT, **PAGES})
+    output = _print_site(session)
+    positions = [output.index(f"<{key}>") for key in ("alpha.md", "Beta.md", "zeta.md")]
+    assert positions == sorted(positions)
+    assert "beta page" in output
+    assert sorted(session.calls[1:]) == sorted(PAGES)
+
+
+def test_only_headers_fetches_no_pages():
+    session = FakeSession({f"{BASE_URL}llms.txt": LLMS_TXT, **PAGES})
+    output = _print_site(session, Context(only_headers=True))
+    assert "zeta.md" in output
+    assert session.calls == [f"{BASE_URL}llms.txt"]
+
+
+def test_prefetch_respects_max_files():
+    session = FakeSession({f"{BASE_URL}llms.txt": LLMS_TXT, **PAGES})
+    output = _print_site(session, Context(max_files=1))
+    assert "<alpha.md>" in output
+    assert session.calls == [f"{BASE_URL}llms.txt", f"{BASE_URL}alpha.md"]
+
+
+def test_failed_page_raises_through_read_file_bytes():
+    session = FakeSession({f"{BASE_URL}llms.txt": LLMS_TXT, **PAGES, f"{BASE_URL}Beta.md": 500})
+    with pytest.raises(requests.HTTPError):
+        _print_site(session)
+    # The failed prefetch was retried by the regular read, which raised.
+    assert session.calls.count(f"{BASE_URL}Beta.md") == 2
+
+
+DEDUPE_PAGES = {
+    f"{BASE_URL}a/page": "from a\n",
+    f"{BASE_URL}page.2": "literal\n",
+    f"{BASE_URL}b/page": "from b\n",
+    f"{BASE_URL}c/page": "from c\n",
+}
+
+
+@pytest.mark.parametrize(
+    ("order", "expected"),
+    [
+        # The literal "page.2" is listed before the second "page", which then probes on to ".3".
+        (
+            ["a/page", "page.2", "b/page", "c/page"],
+            "<page>\nfrom a\n</page>\n"
+            "<page.2>\nliteral\n</page.2>\n"
+            "<page.3>\nfrom b\n</page.3>\n"
+            "<page.4>\nfrom c\n</page.4>\n",
+        ),
+        # Listed after the repeats, the literal "page.2" is itself a repeat and gets ".2.2".
+        (
+            ["a/page", "b/page", "c/page", "page.2"],
+            "<page>\nfrom a\n</page>\n"
+            "<page.2>\nfrom b\n</page.2>\n"
+            "<page.2.2>\nliteral\n</page.2.2>\n"
+            "<page.3>\nfrom c\n</page.3>\n",
+        ),
+    ],
+    ids=["literal-first", "literal-last"],
+)
+def test_repeated_basenames_get_unique_keys(order, expected):
+    llms_txt = "".join(f"- [{path}]({BASE_URL}{path})\n" for path in order)
+    session = FakeSession({f"{BASE_URL}llms.txt": llms_txt, **DEDUPE_PAGES})
+    assert _print_site(session) == expected
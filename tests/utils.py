@@ -1,14 +1,41 @@
+import functools
+import json
 import os
+import re
+import threading
 from pathlib import Path
+from typing import Any, Collection, Iterable
+
+import requests
+
+from prin.adapters.filesystem import FileSystemSource
+from prin.cli_common import parse_common_args
+from prin.core import DepthFirstPrinter, StringWriter
+from prin.formatters import XmlFormatter
 
 
 def write_file(path: Path, content: str | None) -> None:
+    """Write `content` to `path`, creating its parent directories. None creates `path` as a directory."""
     path = Path(path)
-    if content is None:
-        path.mkdir(parents=True, exist_ok=True)
-        return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    write_files(path.parent, {path.name: content})
+
+
+def write_files(root: Path, files: dict[str, str | None]) -> None:
+    """
+    Write `files` (relative path -> content) under `root`. None content creates a directory, as in write_file.
+
+    Each directory is created once: only the deepest directories get a mkdir call,
+    which creates their ancestors along the way.
+    """
+    root = Path(root)
+    paths = {root / rel: content for rel, content in files.items()}
+    dirs = {path if content is None else path.parent for path, content in paths.items()}
+    ancestors = {ancestor for directory in dirs for ancestor in directory.parents}
+    for leaf_dir in dirs - ancestors:
+        leaf_dir.mkdir(parents=True, exist_ok=True)
+    for path, content in paths.items():
+        if content is not None:
+            path.write_text(content, encoding="utf-8")
 
 
 def touch_file(path: Path) -> None:
@@ -29,5 +56,82 @@ def count_opening_xml_tags(text: str) -> int:
     )
 
 
+_XML_TAG_LINE_RE = re.compile(r"<([^/>][^>]*?)/?>")
+
+
+@functools.cache
+def printed_xml_paths(text: str) -> frozenset[str]:
+    """
+    Return the paths of all files printed in XML `text`: opening tags and binary self-closing tags.
+
+    Parses `text` once, so asserting on many paths costs a set lookup each instead of a scan of `text`.
+    For positive checks only: a negative check against the parsed set passes vacuously if the tag
+    format changes, so assert absence against `text` itself (e.g. assert_none_in(paths, text)).
+    """
+    return frozenset(m[1] for line in text.splitlines() if (m := _XML_TAG_LINE_RE.fullmatch(line)))
+
+
+def assert_all_in(items: Iterable[str], collection: Collection[str]) -> None:
+    """Assert every item is in `collection`, reporting all missing items at once."""
+    missing = [item for item in items if item not in collection]
+    assert not missing, f"missing: {missing}"
+
+
+def assert_none_in(items: Iterable[str], collection: Collection[str]) -> None:
+    """Assert no item is in `collection`, reporting all unexpected items at once."""
+    unexpected = [item for item in items if item in collection]
+    assert not unexpected, f"unexpected: {unexpected}"
+
+
 def count_md_headers(text: str) -> int:
     return sum(1 for line in text.splitlines() if line.startswith("## FILE: "))
+
+
+class FakeSession:
+    """
+    A requests.Session stand-in serving canned responses by URL (query parameters are ignored).
+
+    A route's value is the body: bytes/str as is, anything else as JSON. An int value is an error
+    status with an empty body; an unrouted URL is a 404. Every requested URL is recorded in `calls`.
+    """
+
+    def __init__(self, routes: dict[str, Any]) -> None:
+        self.headers: dict[str, str] = {}
+        self.routes = routes
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params=None, timeout=None) -> requests.Response:
+        with self._lock:
+            self.calls.append(url)
+        body = self.routes.get(url, 404)
+        resp = requests.Response()
+        resp.url = url
+        resp.encoding = "utf-8"
+        resp.status_code = 200
+        if isinstance(body, int):
+            resp.status_code, body = body, b""
+        elif isinstance(body, str):
+            body = body.encode("utf-8")
+        elif not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        resp._content = body
+        return resp
+
+
+@functools.cache
+def run_prin(argv: tuple[str, ...]) -> str:
+    """
+    Print the directory given in `argv` (after any flags and the pattern) anchored at itself,
+    and return the XML output.
+
+    Memoized per argv: fixtures like fs_root are read-only, so tests that share an argv
+    share a single traversal. Cleared at session end by conftest.pytest_sessionfinish.
+    """
+    ctx = parse_common_args(list(argv))
+    root = ctx.paths[0]
+    source = FileSystemSource(anchor=root)
+    writer = StringWriter()
+    printer = DepthFirstPrinter(source, XmlFormatter(), ctx)
+    printer.run_pattern(ctx.pattern, None, writer)
+    return writer.text()